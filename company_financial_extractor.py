@@ -1,23 +1,137 @@
 import requests
 import json
-from typing import Dict, Optional, Any
+import logging
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _loads(content: bytes) -> Any:
+    """レスポンスボディをJSONとしてデコード（orjsonがあれば優先して使用）"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class GBizInfoAPI:
     """gBizInfo REST API クライアント"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_workers: int = 8, cache: Optional[Any] = None,
+                 cache_ttl: int = 86400, refresh_cache: bool = False):
         """
         初期化
         
         Args:
             api_key (str): gBizInfo APIキー
+            max_workers (int): 複数企業を並行取得する際の最大スレッド数
+            cache (Any, optional): レスポンスキャッシュ（redis.Redis 互換の get/setex を持つオブジェクト）
+            cache_ttl (int): キャッシュの有効期間（秒）
+            refresh_cache (bool): True の場合キャッシュを読まずに再取得する（書き込みは行う）
         """
         self.api_key = api_key
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.refresh_cache = refresh_cache
+        
+        # 財務情報を基本情報と並行して取得するためのスレッドプール
+        self._fetch_executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+        # 実行中のリクエスト（同一URLへの同時リクエストを1本にまとめる）
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
         self.base_url = "https://info.gbiz.go.jp/hojin"
         self.headers = {
             "X-hojinInfo-api-token": api_key,
             "Accept": "application/json"
         }
+        
+        # 接続を使い回すためのセッション（keep-alive・コネクションプール・リトライ）
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_maxsize=max_workers * 2, max_retries=retries)
+        self.session.mount("https://", adapter)
+    
+    def close(self) -> None:
+        """スレッドプールを停止し、セッションを閉じて接続を解放"""
+        self._fetch_executor.shutdown(wait=True)
+        self.session.close()
+    
+    def __enter__(self) -> "GBizInfoAPI":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _get_json(self, url: str, cache_key: str) -> Any:
+        """
+        URLからJSONを取得（同一URLへの同時リクエストは結果を共有）
+        
+        Args:
+            url (str): リクエストURL
+            cache_key (str): キャッシュキー
+            
+        Returns:
+            Any: デコードしたJSON
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(url)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[url] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            future.set_result(self._fetch_json(url, cache_key))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(url, None)
+        return future.result()
+    
+    def _fetch_json(self, url: str, cache_key: str) -> Any:
+        """
+        URLからJSONを取得（キャッシュがあればキャッシュを優先）
+        
+        Args:
+            url (str): リクエストURL
+            cache_key (str): キャッシュキー
+            
+        Returns:
+            Any: デコードしたJSON
+        """
+        if self.cache is not None and not self.refresh_cache:
+            try:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return _loads(cached)
+            except Exception as e:
+                logger.warning("キャッシュ読み込みエラー: %s", e)
+        
+        response = self.session.get(url)
+        response.raise_for_status()
+        data = _loads(response.content)
+        
+        if self.cache is not None:
+            try:
+                self.cache.setex(cache_key, self.cache_ttl, response.content)
+            except Exception as e:
+                logger.warning("キャッシュ書き込みエラー: %s", e)
+        return data
     
     def get_basic_info(self, corporate_number: str) -> Optional[Dict[str, Any]]:
         """
@@ -32,11 +146,9 @@ class GBizInfoAPI:
         url = f"{self.base_url}/v1/hojin/{corporate_number}"
         
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"基本情報取得エラー: {e}")
+            return self._get_json(url, f"gbiz:basic:{corporate_number}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("基本情報取得エラー: %s", e)
             return None
     
     def get_finance_info(self, corporate_number: str) -> Optional[Dict[str, Any]]:
@@ -52,11 +164,9 @@ class GBizInfoAPI:
         url = f"{self.base_url}/v1/hojin/{corporate_number}/finance"
         
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"財務情報取得エラー: {e}")
+            return self._get_json(url, f"gbiz:finance:{corporate_number}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("財務情報取得エラー: %s", e)
             return None
     
     def extract_company_data(self, corporate_number: str) -> Dict[str, Any]:
@@ -79,11 +189,14 @@ class GBizInfoAPI:
             "status": "success"
         }
         
-        # 基本情報を取得
+        # 財務情報はバックグラウンドで取得し、基本情報はこのスレッドで取得
+        finance_future = self._fetch_executor.submit(self.get_finance_info, corporate_number)
         basic_info = self.get_basic_info(corporate_number)
         if not basic_info:
+            finance_future.cancel()
             result["status"] = "error: 基本情報取得失敗"
             return result
+        finance_info = finance_future.result()
         
         # 基本情報から抽出
         try:
@@ -106,10 +219,9 @@ class GBizInfoAPI:
                 if "homepage-url" in hojin_info:
                     result["website_url"] = hojin_info["homepage-url"]
         except Exception as e:
-            print(f"基本情報解析エラー: {e}")
+            logger.error("基本情報解析エラー: %s", e)
         
-        # 財務情報を取得
-        finance_info = self.get_finance_info(corporate_number)
+        # 財務情報から抽出
         if finance_info:
             try:
                 finance_infos = finance_info.get("finance-infos", [])
@@ -124,10 +236,26 @@ class GBizInfoAPI:
                         result["revenue"] = latest_finance["sales"]
                         
             except Exception as e:
-                print(f"財務情報解析エラー: {e}")
+                logger.error("財務情報解析エラー: %s", e)
         
         return result
     
+    def extract_companies_data(self, corporate_numbers: List[str]) -> List[Dict[str, Any]]:
+        """
+        複数企業の主要情報を並行して抽出
+        
+        Args:
+            corporate_numbers (List[str]): 法人番号（13桁）のリスト
+            
+        Returns:
+            List[Dict[str, Any]]: 入力順に並んだ企業情報のリスト
+        """
+        # 重複する法人番号は一度だけ取得し、入力順に展開し直す
+        unique_numbers = list(dict.fromkeys(corporate_numbers))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            unique_results = dict(zip(unique_numbers, executor.map(self.extract_company_data, unique_numbers)))
+        return [dict(unique_results[number]) for number in corporate_numbers]
+    
     def format_output(self, data: Dict[str, Any]) -> str:
         """
         取得データを整形して出力
@@ -155,10 +283,14 @@ WebサイトURL: {data['website_url'] or 'データなし'}
 
 # 使用例
 def main():
+    # ログ出力の設定
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # APIキーを設定（実際のキーに置き換えてください）
     API_KEY = "your_api_key_here"
     
     # APIクライアントを初期化
+    # Redisでレスポンスをキャッシュする場合: GBizInfoAPI(API_KEY, cache=redis.Redis())
     api_client = GBizInfoAPI(API_KEY)
     
     # 調査対象の法人番号（例：トヨタ自動車の法人番号）
@@ -168,12 +300,14 @@ def main():
         # 他の法人番号を追加
     ]
     
-    # 各企業の情報を調査
-    for corp_num in corporate_numbers:
-        print(f"\n=== 法人番号: {corp_num} の調査開始 ===")
-        
-        # 企業データを取得・抽出
-        company_data = api_client.extract_company_data(corp_num)
+    # 全企業の情報を並行して取得・抽出
+    try:
+        results = api_client.extract_companies_data(corporate_numbers)
+    finally:
+        api_client.close()
+    
+    for corp_num, company_data in zip(corporate_numbers, results):
+        print(f"\n=== 法人番号: {corp_num} の調査結果 ===")
         
         # 結果を表示
         print(api_client.format_output(company_data))
@@ -183,9 +317,9 @@ def main():
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(company_data, f, ensure_ascii=False, indent=2)
-            print(f"データを {filename} に保存しました")
+            logger.info("データを %s に保存しました", filename)
         except Exception as e:
-            print(f"ファイル保存エラー: {e}")
+            logger.error("ファイル保存エラー: %s", e)
 
 if __name__ == "__main__":
     main()